@@ -3,22 +3,43 @@ from flask_cors import CORS
 import firebase_admin
 from firebase_admin import credentials
 import os
+from app.metrics import Metrics, init_metrics
+from app.storage.memory import MemoryFirestore
 
-def create_app():
+def create_app(config=None):
     app = Flask(__name__)
     CORS(app)  # Frontend (Port 3000) erişimine izin ver
 
-    # Firebase Başlatma - Mutlak dosya yolu kullan
-    try:
-        # __file__ içeren dizini al (app klasörü)
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        service_account_path = os.path.join(base_dir, "serviceAccountKey.json")
-        
-        cred = credentials.Certificate(service_account_path)
-        firebase_admin.initialize_app(cred)
-        print("[INFO] Firebase Connected Successfully.")
-    except Exception as e:
-        print(f"[WARNING] Firebase not connected. Using Mock Data. Error: {e}")
+    # Firestore arka ucu: "firebase" (varsayılan) veya "memory" (yerel, bellekte)
+    app.config.from_mapping(
+        FIRESTORE_BACKEND=os.environ.get('BOOKMIND_FIRESTORE', 'firebase'),
+        FIRESTORE_LATENCY_MS=float(os.environ.get('BOOKMIND_FIRESTORE_LATENCY_MS', 0)),
+    )
+    if config:
+        app.config.update(config)
+
+    if app.config['FIRESTORE_BACKEND'] == 'memory':
+        _use_memory_firestore(app)
+    else:
+        # Firebase Başlatma - Mutlak dosya yolu kullan
+        # Kimlik bilgileri yüklenemezse uygulama başlamaz; bellekteki Firestore yalnızca
+        # açıkça seçildiğinde (BOOKMIND_FIRESTORE=memory) kullanılır, veriler yeniden başlatmada kaybolur.
+        try:
+            firebase_admin.get_app()  # create_app aynı süreçte ikinci kez çağrıldıysa mevcut uygulamayı kullan
+        except ValueError:
+            # __file__ içeren dizini al (app klasörü)
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            service_account_path = os.path.join(base_dir, "serviceAccountKey.json")
+
+            try:
+                cred = credentials.Certificate(service_account_path)
+                firebase_admin.initialize_app(cred)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Firebase not connected: {e}. "
+                    "Provide serviceAccountKey.json or set BOOKMIND_FIRESTORE=memory for a local in-memory store."
+                ) from e
+            print("[INFO] Firebase Connected Successfully.")
 
     # Blueprint'leri kaydet
     from app.api.auth import auth_bp
@@ -27,6 +48,18 @@ def create_app():
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(books_bp, url_prefix='/api/books')
 
+    # Route süreleri, Firestore çağrıları ve önbellek sayaçları -> /metrics (Prometheus)
+    from app.ml.recommender import get_recommender
+    get_recommender()  # Modeli açılışta eğit, ilk istek beklemesin
+    metrics = Metrics()
+    metrics.register('bookmind_recommender_cache_hits_total', 'Recommendation cache hits.',
+                     lambda: get_recommender().cache_hits)
+    metrics.register('bookmind_recommender_cache_misses_total', 'Recommendation cache misses.',
+                     lambda: get_recommender().cache_misses)
+    metrics.register('bookmind_catalog_books', 'Books loaded into the recommender.',
+                     lambda: len(get_recommender().books_data), kind='gauge')
+    init_metrics(app, metrics)
+
     # Root endpoint (Test için)
     @app.route('/')
     def home():
@@ -34,8 +67,15 @@ def create_app():
             "message": "BookMind API is running! ✨",
             "endpoints": {
                 "auth": "/api/auth/login",
-                "books": "/api/books/search?query=harry"
+                "books": "/api/books/search?query=harry",
+                "metrics": "/metrics"
             }
         })
 
-    return app
\ No newline at end of file
+    return app
+
+
+def _use_memory_firestore(app):
+    latency = app.config['FIRESTORE_LATENCY_MS'] / 1000.0
+    app.extensions['firestore'] = MemoryFirestore(latency=latency)
+    print(f"[INFO] Using in-memory Firestore (latency: {app.config['FIRESTORE_LATENCY_MS']} ms).")
@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify
 from firebase_admin import firestore
+from app.storage.db import get_db
 import uuid
 
 auth_bp = Blueprint('auth', __name__)
@@ -14,7 +15,7 @@ def register():
     if not username:
         return jsonify({"error": "Kullanıcı adı zorunludur."}), 400
 
-    db = firestore.client()
+    db = get_db()
     users_ref = db.collection('users')
 
     email_query = users_ref.where('email', '==', email).stream()
@@ -43,7 +44,7 @@ def login():
     username = data.get('username') 
     password = data.get('password')
 
-    db = firestore.client()
+    db = get_db()
     
     users = db.collection('users').where('username', '==', username).stream()
     
@@ -64,7 +65,7 @@ def login():
 
 @auth_bp.route('/user/<user_id>', methods=['GET'])
 def get_user_info(user_id):
-    db = firestore.client()
+    db = get_db()
     user_ref = db.collection('users').document(user_id).get()
     
     if user_ref.exists:
@@ -92,7 +93,7 @@ def follow_user():
     if follower_id == following_id:
         return jsonify({"error": "Kendinizi takip edemezsiniz."}), 400
     
-    db = firestore.client()
+    db = get_db()
     
     db.collection('following').document(follower_id).collection('user_following').document(following_id).set({
         "followed_at": firestore.SERVER_TIMESTAMP
@@ -110,7 +111,7 @@ def unfollow_user():
     follower_id = data.get('follower_id')
     following_id = data.get('following_id')
     
-    db = firestore.client()
+    db = get_db()
     
     db.collection('following').document(follower_id).collection('user_following').document(following_id).delete()
     
@@ -123,14 +124,14 @@ def check_following():
     follower_id = request.args.get('follower_id')
     following_id = request.args.get('following_id')
     
-    db = firestore.client()
+    db = get_db()
     doc = db.collection('following').document(follower_id).collection('user_following').document(following_id).get()
     
     return jsonify({"is_following": doc.exists}), 200
 
 @auth_bp.route('/user/<user_id>/followers', methods=['GET'])
 def get_followers(user_id):
-    db = firestore.client()
+    db = get_db()
     followers_ref = db.collection('followers').document(user_id).collection('user_followers').stream()
     
     followers = []
@@ -148,7 +149,7 @@ def get_followers(user_id):
 
 @auth_bp.route('/user/<user_id>/following', methods=['GET'])
 def get_following(user_id):
-    db = firestore.client()
+    db = get_db()
     following_ref = db.collection('following').document(user_id).collection('user_following').stream()
     
     following = []
@@ -176,7 +177,7 @@ def search_users():
         return jsonify([])
 
     try:
-        db = firestore.client()
+        db = get_db()
         users_ref = db.collection('users').stream()
         
         filtered_users = []
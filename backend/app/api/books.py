@@ -1,7 +1,8 @@
 import pandas as pd
 from flask import Blueprint, request, jsonify
-from app.ml.recommender import recommender_engine
+from app.ml.recommender import get_recommender
 from firebase_admin import firestore
+from app.storage.db import get_db
 import datetime
 import random
 from collections import Counter
@@ -13,10 +14,8 @@ def search_books():
     query = request.args.get('query', '').lower()
     
     try:
-        df = recommender_engine.books_data
         # Filter books where title or author contains the query
-        results = df[df['title'].str.contains(query, case=False, na=False) | 
-                     df['author'].str.contains(query, case=False, na=False)].head(20)
+        results = get_recommender().search_books(query, limit=20)
         
         books = []
         for _, row in results.iterrows():
@@ -38,7 +37,7 @@ def rate_book(book_id):
     data = request.json
     user_id = data.get('user_id')
     
-    db = firestore.client()
+    db = get_db()
     
     user_ref = db.collection('users').document(user_id).get()
     current_username = "Anonymous"  # Changed from "Anonim"
@@ -81,10 +80,10 @@ def rate_book(book_id):
 
 @books_bp.route('/ratings/recent', methods=['GET'])
 def get_recent_ratings():
-    db = firestore.client()
+    db = get_db()
     ratings_ref = db.collection('ratings').order_by('timestamp', direction=firestore.Query.DESCENDING).limit(20).stream()
     
-    df = recommender_engine.books_data
+    df = get_recommender().books_data
 
     results = []
     for doc in ratings_ref:
@@ -107,7 +106,7 @@ def get_recent_ratings():
 
 @books_bp.route('/<book_id>/reviews', methods=['GET'])
 def get_book_reviews(book_id):
-    db = firestore.client()
+    db = get_db()
     ratings_ref = db.collection('ratings').where('book_id', '==', str(book_id)).stream()
     
     results = []
@@ -121,11 +120,11 @@ def get_book_reviews(book_id):
 
 @books_bp.route('/users/<user_id>/ratings', methods=['GET'])
 def get_user_ratings(user_id):
-    db = firestore.client()
+    db = get_db()
 
     ratings_ref = db.collection('ratings').where('user_id', '==', user_id).stream()
     
-    df = recommender_engine.books_data
+    df = get_recommender().books_data
     
     results = []
     for doc in ratings_ref:
@@ -148,7 +147,7 @@ def get_user_ratings(user_id):
 
 @books_bp.route('/users/<user_id>/recommendations', methods=['GET'])
 def get_recommendations(user_id):
-    db = firestore.client()
+    db = get_db()
     ratings_ref = db.collection('ratings').where('user_id', '==', user_id).stream()
     
     user_ratings = [doc.to_dict() for doc in ratings_ref]
@@ -163,7 +162,7 @@ def get_recommendations(user_id):
     recommendations = []
     
     if not five_star_books and not four_star_books:
-        recommendations = recommender_engine.get_popular_books(n=10)
+        recommendations = get_recommender().get_popular_books(n=10)
     else:
         seed_books = []
         if len(five_star_books) > 7:
@@ -184,7 +183,7 @@ def get_recommendations(user_id):
             rating = book.get('rating', 0)
             limit = 5 if rating == 5 else 2
             
-            similars = recommender_engine.get_recommendations(title)
+            similars = get_recommender().get_recommendations(title)
             
             count = 0
             for rec in similars:
@@ -200,13 +199,13 @@ def get_recommendations(user_id):
         recommendations = [unique_recs_map[title] for title in sorted_titles]
 
     if len(recommendations) < 5:
-        recommendations.extend(recommender_engine.get_popular_books(n=5))
+        recommendations.extend(get_recommender().get_popular_books(n=5))
 
     return jsonify(recommendations[:12]), 200
 
 @books_bp.route('/<book_id>/details', methods=['GET'])
 def get_book_details(book_id):
-    df = recommender_engine.books_data
+    df = get_recommender().books_data
     book_row = df[df['book_id'].astype(str) == str(book_id)]
     
     if book_row.empty:
@@ -220,14 +219,14 @@ def get_book_details(book_id):
 
 @books_bp.route('/<book_id>/similar', methods=['GET'])
 def get_similar_books(book_id):
-    df = recommender_engine.books_data
+    df = get_recommender().books_data
     book_row = df[df['book_id'].astype(str) == str(book_id)]
     
     if book_row.empty:
         return jsonify({"error": "Book not found"}), 404 # Changed from "Kitap bulunamadı"
     
     book_title = book_row.iloc[0]['title']
-    similar_books = recommender_engine.get_recommendations(book_title)
+    similar_books = get_recommender().get_recommendations(book_title)
     
     clean_books = []
     for book in similar_books:
@@ -240,7 +239,7 @@ def get_similar_books(book_id):
 @books_bp.route('/ratings/<rating_id>/like', methods=['POST'])
 def like_rating(rating_id):
     user_id = request.json.get('user_id')
-    db = firestore.client()
+    db = get_db()
     
     rating_ref = db.collection('ratings').document(rating_id)
     doc = rating_ref.get()
@@ -269,7 +268,7 @@ def toggle_wishlist(book_id):
     book_title = data.get('book_title')
     image_url = data.get('image_url')
 
-    db = firestore.client()
+    db = get_db()
     wishlist_ref = db.collection('users').document(user_id).collection('wishlist').document(str(book_id))
     doc = wishlist_ref.get()
     
@@ -287,7 +286,7 @@ def toggle_wishlist(book_id):
 
 @books_bp.route('/users/<user_id>/wishlist', methods=['GET'])
 def get_user_wishlist(user_id):
-    db = firestore.client()
+    db = get_db()
     docs = db.collection('users').document(user_id).collection('wishlist').order_by('added_at', direction=firestore.Query.DESCENDING).stream()
     wishlist = []
     for doc in docs:
@@ -300,7 +299,7 @@ def check_wishlist_status(book_id):
     if not user_id:
         return jsonify({"in_wishlist": False}), 200
         
-    db = firestore.client()
+    db = get_db()
     doc = db.collection('users').document(user_id).collection('wishlist').document(str(book_id)).get()
     return jsonify({"in_wishlist": doc.exists}), 200
 
@@ -311,7 +310,7 @@ def delete_rating(book_id):
     if not user_id:
         return jsonify({"error": "User ID required"}), 400 # Changed from "User ID gerekli"
 
-    db = firestore.client()
+    db = get_db()
 
     main_docs = db.collection('ratings') \
         .where('user_id', '==', user_id) \
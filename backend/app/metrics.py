@@ -0,0 +1,127 @@
+import threading
+import time
+from collections import Counter
+
+from flask import Response, g, has_request_context, request
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Bunların dışındaki HTTP metodları "other" etiketinde toplanır (sınırsız seri oluşmasın)
+KNOWN_METHODS = frozenset(('GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'))
+
+
+class Metrics:
+    """
+    Route süreleri, Firestore çağrıları ve kayıtlı sayaçlar için basit bir kayıt.
+    render() çıktısı Prometheus metin formatındadır (/metrics).
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.requests = Counter()       # (method, route, status) -> adet
+        self.durations = {}             # (method, route) -> [bucket sayıları..., toplam süre, adet]
+        self.firestore_ops = Counter()  # (method, route, op) -> adet
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def observe_request(self, method, route, status, seconds):
+        with self._lock:
+            self.requests[(method, route, str(status))] += 1
+            series = self.durations.setdefault((method, route), [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series[i] += 1
+            series[-2] += seconds
+            series[-1] += 1
+
+    def inc_firestore(self, op):
+        if has_request_context():
+            method, route = _current_method(), _current_route()
+        else:
+            method, route = 'none', 'none'
+        with self._lock:
+            self.firestore_ops[(method, route, op)] += 1
+
+    def register(self, name, help_text, fn, kind='counter'):
+        """
+        Her render() çağrısında fn() ile okunan bir değer ekler (ör. önbellek sayaçları).
+        """
+        self._collectors.append((name, help_text, kind, fn))
+
+    def render(self):
+        with self._lock:
+            requests = dict(self.requests)
+            durations = {key: list(series) for key, series in self.durations.items()}
+            firestore_ops = dict(self.firestore_ops)
+
+        lines = [
+            '# HELP bookmind_requests_total Total HTTP requests by route and status.',
+            '# TYPE bookmind_requests_total counter',
+        ]
+        for (method, route, status), count in sorted(requests.items()):
+            lines.append(f'bookmind_requests_total{_labels(method=method, route=route, status=status)} {count}')
+
+        lines += [
+            '# HELP bookmind_request_duration_seconds HTTP request latency by route.',
+            '# TYPE bookmind_request_duration_seconds histogram',
+        ]
+        for (method, route), series in sorted(durations.items()):
+            for bound, count in zip(self.buckets, series):
+                lines.append('bookmind_request_duration_seconds_bucket'
+                             f'{_labels(method=method, route=route, le=repr(bound))} {count}')
+            lines.append('bookmind_request_duration_seconds_bucket'
+                         f'{_labels(method=method, route=route, le="+Inf")} {series[-1]}')
+            lines.append(f'bookmind_request_duration_seconds_sum{_labels(method=method, route=route)} {series[-2]}')
+            lines.append(f'bookmind_request_duration_seconds_count{_labels(method=method, route=route)} {series[-1]}')
+
+        lines += [
+            '# HELP bookmind_firestore_ops_total Firestore calls (get, set, stream, commit...) by route.',
+            '# TYPE bookmind_firestore_ops_total counter',
+        ]
+        for (method, route, op), count in sorted(firestore_ops.items()):
+            lines.append(f'bookmind_firestore_ops_total{_labels(method=method, route=route, op=op)} {count}')
+
+        for name, help_text, kind, fn in self._collectors:
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}', f'{name} {fn()}']
+
+        return '\n'.join(lines) + '\n'
+
+
+def init_metrics(app, metrics):
+    """
+    Route zamanlama middleware'ini ve /metrics endpoint'ini uygulamaya ekler.
+    """
+    app.extensions['metrics'] = metrics
+
+    @app.before_request
+    def _start_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _record_request(response):
+        started = g.pop('request_started', None)
+        if started is not None:
+            metrics.observe_request(_current_method(), _current_route(), response.status_code,
+                                    time.perf_counter() - started)
+        return response
+
+    @app.route('/metrics')
+    def prometheus_metrics():
+        return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
+def _current_method():
+    return request.method if request.method in KNOWN_METHODS else 'other'
+
+
+def _current_route():
+    # URL şablonu kullanılır (/api/books/<book_id>/details); eşleşmeyen istekler tek etikette toplanır
+    return request.url_rule.rule if request.url_rule else 'unmatched'
+
+
+def _labels(**labels):
+    escaped = (f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return '{' + ','.join(escaped) + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
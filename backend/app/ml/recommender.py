@@ -1,14 +1,29 @@
 import pandas as pd
+import numpy as np
 import os
+import threading
+from collections import OrderedDict
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import linear_kernel
 
 class Recommender:
-    def __init__(self):
+    def __init__(self, data_path=None, max_books=5000, cache_size=1024):
+        """
+        data_path: Books.csv yolu (varsayılan: backend/data/Books.csv)
+        max_books: Okunacak en fazla kitap sayısı, None ise tüm katalog
+        cache_size: get_recommendations sonuç önbelleğinin boyutu
+        """
         # Dosya yolunu belirle
         current_dir = os.path.dirname(os.path.abspath(__file__))
         # backend/app/ml -> backend/data/Books.csv yoluna çık
-        self.data_path = os.path.join(current_dir, '..', '..', 'data', 'Books.csv')
+        self.data_path = data_path or os.path.join(current_dir, '..', '..', 'data', 'Books.csv')
+
+        # Öneri önbelleği ve sayaçları (/metrics için)
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         print(f"Veri seti aranıyor: {self.data_path}")
         
@@ -18,7 +33,8 @@ class Recommender:
                 raise FileNotFoundError("Dosya fiziksel olarak yok.")
 
             self.books_data = pd.read_csv(self.data_path, sep=',', on_bad_lines='skip', encoding="latin-1", low_memory=False)
-            self.books_data = self.books_data.head(5000) # İlk 5000 kitap (Performans için)
+            if max_books is not None:
+                self.books_data = self.books_data.head(max_books) # İlk N kitap (Performans için)
             print("CSV dosyası başarıyla yüklendi.")
             
         except Exception as e:
@@ -55,7 +71,8 @@ class Recommender:
     def _train_model(self):
         if self.books_data.empty:
             print("UYARI: Veri seti boş olduğu için model eğitilemedi.")
-            self.cosine_sim = []
+            self.tfidf_matrix = None
+            self._title_index = {}
             return
 
         # İçerik tabanlı filtreleme için özellikleri birleştir
@@ -65,40 +82,66 @@ class Recommender:
             self.books_data['publisher']
         )
 
+        # Başlık -> satır numarası (aynı başlıkta ilk kitap)
+        self._title_index = {}
+        for position, title in enumerate(self.books_data['title'].values):
+            self._title_index.setdefault(title, position)
+
         # TF-IDF Matrisini Oluştur
+        # Benzerlik satırları sorgu anında hesaplanır; n x n matris büyük kataloglarda belleğe sığmaz.
         tfidf = TfidfVectorizer(stop_words='english')
         try:
-            tfidf_matrix = tfidf.fit_transform(self.books_data['combined_features'])
-            self.cosine_sim = linear_kernel(tfidf_matrix, tfidf_matrix)
+            self.tfidf_matrix = tfidf.fit_transform(self.books_data['combined_features'])
             print(f"Model {len(self.books_data)} kitap ile başarıyla eğitildi!")
         except ValueError:
             print("Veri hatası nedeniyle model eğitilemedi.")
-            self.cosine_sim = []
+            self.tfidf_matrix = None
 
     def get_recommendations(self, liked_book_title):
         """
         Belirli bir kitaba benzer kitapları bulur.
         """
-        if self.books_data.empty or liked_book_title not in self.books_data['title'].values:
+        if self.books_data.empty or self.tfidf_matrix is None or liked_book_title not in self._title_index:
             return []
+
+        with self._cache_lock:
+            cached = self._cache.get(liked_book_title)
+            if cached is not None:
+                self._cache.move_to_end(liked_book_title)
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+        if cached is not None:
+            return [dict(book) for book in cached]
         
         try:
             # Kitabın indexini bul
-            idx = self.books_data.index[self.books_data['title'] == liked_book_title][0]
+            idx = self._title_index[liked_book_title]
             
             # Benzerlik skorlarını hesapla
-            sim_scores = list(enumerate(self.cosine_sim[idx]))
-            sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-            
-            # En benzer 5 kitabı al (kendisi hariç)
-            sim_scores = sim_scores[1:6]
+            sim_scores = linear_kernel(self.tfidf_matrix[idx], self.tfidf_matrix).ravel()
             
-            book_indices = [i[0] for i in sim_scores]
-            return self.books_data.iloc[book_indices].to_dict('records')
+            # En benzer 5 kitabı al (kendisi hariç), eşit skorlarda katalog sırası korunur
+            book_indices = np.argsort(-sim_scores, kind='stable')[1:6]
+            recommendations = self.books_data.iloc[book_indices].to_dict('records')
         except Exception as e:
             print(f"Öneri hatası: {e}")
             return []
 
+        with self._cache_lock:
+            self._cache[liked_book_title] = recommendations
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return [dict(book) for book in recommendations]
+
+    def search_books(self, query, limit=20):
+        """
+        Başlığında veya yazarında sorgu geçen kitapları döndürür.
+        """
+        df = self.books_data
+        return df[df['title'].str.contains(query, case=False, na=False) |
+                  df['author'].str.contains(query, case=False, na=False)].head(limit)
+
     def get_popular_books(self, n=5):
         """
         Kullanıcının beğenisi yoksa veya veri yetersizse
@@ -114,4 +157,23 @@ class Recommender:
             # Eğer istenen sayı (n) veri setinden büyükse hepsini döndür
             return self.books_data.to_dict('records')
 
-recommender_engine = Recommender()
\ No newline at end of file
+_recommender_engine = None
+
+
+def get_recommender():
+    """
+    Uygulamanın ortak Recommender örneğini döndürür; ilk çağrıda varsayılan katalogla oluşturulur.
+    Sınıfı içe aktarmak (ör. benchmark'larda) modeli eğitmez.
+    """
+    global _recommender_engine
+    if _recommender_engine is None:
+        _recommender_engine = Recommender()
+    return _recommender_engine
+
+
+def set_recommender(engine):
+    """
+    Ortak örneği değiştirir (ör. benchmark'ta sentetik katalogla eğitilmiş bir model).
+    """
+    global _recommender_engine
+    _recommender_engine = engine
@@ -0,0 +1,18 @@
+from flask import current_app
+from firebase_admin import firestore
+from app.storage.instrumented import CountingClient
+
+
+def get_db():
+    """
+    Aktif Firestore istemcisini döndürür.
+    create_app yerel bir istemci kaydettiyse (MemoryFirestore) onu, yoksa Firebase istemcisini kullanır.
+    Metrikler açıksa istemci, Firestore çağrılarını sayan CountingClient ile sarılır.
+    """
+    client = current_app.extensions.get('firestore')
+    if client is None:
+        client = firestore.client()
+    metrics = current_app.extensions.get('metrics')
+    if metrics is not None:
+        client = CountingClient(client, metrics)
+    return client
@@ -0,0 +1,85 @@
+class CountingClient:
+    """
+    Firestore istemcisini (Firebase veya MemoryFirestore) saran ve her RPC'yi
+    Metrics.inc_firestore ile sayan ince bir katman. Referanslar, sorgular ve
+    batch'ler de sarılır; RPC olmayan çağrılar olduğu gibi iletilir.
+    """
+
+    def __init__(self, client, metrics):
+        self._target = client
+        self._metrics = metrics
+
+    def collection(self, name):
+        return _Reference(self._target.collection(name), self._metrics)
+
+    def batch(self):
+        return _Batch(self._target.batch(), self._metrics)
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+class _Reference:
+    # CollectionReference, DocumentReference ve Query için ortak sarmalayıcı
+    _chained = ('collection', 'document', 'where', 'order_by', 'limit')
+
+    def __init__(self, target, metrics):
+        self._target = target
+        self._metrics = metrics
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name in self._chained:
+            return lambda *args, **kwargs: _Reference(attr(*args, **kwargs), self._metrics)
+        if name == 'stream':
+            return lambda *args, **kwargs: self._stream(attr, *args, **kwargs)
+        if name in ('get', 'set', 'update', 'delete', 'add', 'create'):
+            return self._counted(name, attr)
+        return attr
+
+    def _counted(self, op, method):
+        def call(*args, **kwargs):
+            self._metrics.inc_firestore(op)
+            return method(*args, **kwargs)
+        return call
+
+    def _stream(self, method, *args, **kwargs):
+        self._metrics.inc_firestore('query')
+        for snapshot in method(*args, **kwargs):
+            yield _Snapshot(snapshot, self._metrics)
+
+
+class _Snapshot:
+    def __init__(self, target, metrics):
+        self._target = target
+        self._metrics = metrics
+
+    @property
+    def reference(self):
+        return _Reference(self._target.reference, self._metrics)
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+class _Batch:
+    def __init__(self, target, metrics):
+        self._target = target
+        self._metrics = metrics
+
+    def set(self, reference, *args, **kwargs):
+        return self._target.set(_unwrap(reference), *args, **kwargs)
+
+    def update(self, reference, *args, **kwargs):
+        return self._target.update(_unwrap(reference), *args, **kwargs)
+
+    def delete(self, reference, *args, **kwargs):
+        return self._target.delete(_unwrap(reference), *args, **kwargs)
+
+    def commit(self, *args, **kwargs):
+        self._metrics.inc_firestore('commit')
+        return self._target.commit(*args, **kwargs)
+
+
+def _unwrap(reference):
+    return reference._target if isinstance(reference, _Reference) else reference
@@ -0,0 +1,281 @@
+import copy
+import datetime
+import threading
+import time
+import uuid
+from collections import Counter
+
+from firebase_admin import firestore
+from google.api_core.exceptions import NotFound
+
+
+class MemoryFirestore:
+    """
+    Firebase olmadan çalışmak için bellekte tutulan Firestore yerine geçen istemci.
+    auth.py ve books.py içinde kullanılan işlemleri destekler:
+    collection/document/subcollection, where/order_by/limit, add, set(merge),
+    update, delete, batch ve SERVER_TIMESTAMP.
+
+    latency: Her RPC (get, set, stream, commit...) öncesi eklenen gecikme (saniye).
+    stats: İşlem türüne göre sayaç; ops toplam RPC sayısını verir.
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.stats = Counter()
+        self._collections = {}
+        self._lock = threading.Lock()
+
+    # --- Public API (firestore.Client ile aynı isimler) ---
+
+    def collection(self, name):
+        return CollectionReference(self, name)
+
+    def batch(self):
+        return WriteBatch(self)
+
+    # --- Ölçüm yardımcıları ---
+
+    @property
+    def ops(self):
+        return sum(self.stats.values())
+
+    def reset_stats(self):
+        self.stats.clear()
+
+    def clear(self):
+        with self._lock:
+            self._collections.clear()
+        self.reset_stats()
+
+    # --- İç işlemler ---
+
+    def _rpc(self, kind):
+        self.stats[kind] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _docs(self, collection_path):
+        return self._collections.setdefault(collection_path, {})
+
+    def _read(self, collection_path, doc_id):
+        with self._lock:
+            data = self._collections.get(collection_path, {}).get(doc_id)
+            return copy.deepcopy(data)
+
+    def _write(self, collection_path, doc_id, data, merge=False):
+        data = _resolve_sentinels(data)
+        with self._lock:
+            docs = self._docs(collection_path)
+            if merge and doc_id in docs:
+                _deep_merge(docs[doc_id], data)
+            else:
+                docs[doc_id] = data
+
+    def _update(self, collection_path, doc_id, data):
+        data = _resolve_sentinels(data)
+        with self._lock:
+            docs = self._docs(collection_path)
+            if doc_id not in docs:
+                raise NotFound(f"No document to update: {collection_path}/{doc_id}")
+            docs[doc_id].update(data)
+
+    def _delete(self, collection_path, doc_id):
+        with self._lock:
+            self._collections.get(collection_path, {}).pop(doc_id, None)
+
+    def _select(self, collection_path, filters, orders, limit):
+        with self._lock:
+            docs = self._collections.get(collection_path, {})
+            # Firestore, sıralama alanı olmayan dökümanları sonuçtan çıkarır
+            matches = [(doc_id, data) for doc_id, data in docs.items()
+                       if all(field in data and _OPERATORS[op](data[field], value) for field, op, value in filters)
+                       and all(field in data for field, _ in orders)]
+            for field, direction in reversed(orders):
+                matches.sort(key=lambda item: item[1][field],
+                             reverse=direction == firestore.Query.DESCENDING)
+            if limit is not None:
+                matches = matches[:limit]
+            return [(doc_id, copy.deepcopy(data)) for doc_id, data in matches]
+
+
+class CollectionReference:
+    def __init__(self, client, path):
+        self._client = client
+        self.path = path
+        self.id = path.rsplit('/', 1)[-1]
+
+    def document(self, document_id=None):
+        if document_id is None:
+            document_id = uuid.uuid4().hex[:20]
+        return DocumentReference(self._client, self.path, str(document_id))
+
+    def add(self, document_data, document_id=None):
+        doc_ref = self.document(document_id)
+        doc_ref.set(document_data)
+        return _now(), doc_ref
+
+    def where(self, field_path, op_string, value):
+        return Query(self).where(field_path, op_string, value)
+
+    def order_by(self, field_path, direction=firestore.Query.ASCENDING):
+        return Query(self).order_by(field_path, direction=direction)
+
+    def limit(self, count):
+        return Query(self).limit(count)
+
+    def stream(self):
+        return Query(self).stream()
+
+    def get(self):
+        return list(self.stream())
+
+
+class DocumentReference:
+    def __init__(self, client, collection_path, document_id):
+        self._client = client
+        self._collection_path = collection_path
+        self.id = document_id
+        self.path = f"{collection_path}/{document_id}"
+
+    def collection(self, name):
+        return CollectionReference(self._client, f"{self.path}/{name}")
+
+    def get(self):
+        self._client._rpc('get')
+        data = self._client._read(self._collection_path, self.id)
+        return DocumentSnapshot(self, data)
+
+    def set(self, document_data, merge=False):
+        self._client._rpc('set')
+        self._client._write(self._collection_path, self.id, document_data, merge=merge)
+
+    def update(self, field_updates):
+        self._client._rpc('update')
+        self._client._update(self._collection_path, self.id, field_updates)
+
+    def delete(self):
+        self._client._rpc('delete')
+        self._client._delete(self._collection_path, self.id)
+
+
+class DocumentSnapshot:
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+
+    @property
+    def exists(self):
+        return self._data is not None
+
+    def to_dict(self):
+        return copy.deepcopy(self._data)
+
+    def get(self, field_path):
+        return (self._data or {}).get(field_path)
+
+
+class Query:
+    def __init__(self, parent, filters=None, orders=None, limit=None):
+        self._parent = parent
+        self._filters = filters or []
+        self._orders = orders or []
+        self._limit = limit
+
+    def _copy(self, **changes):
+        state = {
+            'filters': list(self._filters),
+            'orders': list(self._orders),
+            'limit': self._limit,
+        }
+        state.update(changes)
+        return Query(self._parent, **state)
+
+    def where(self, field_path, op_string, value):
+        if op_string not in _OPERATORS:
+            raise ValueError(f"Unsupported operator: {op_string}")
+        return self._copy(filters=self._filters + [(field_path, op_string, value)])
+
+    def order_by(self, field_path, direction=firestore.Query.ASCENDING):
+        return self._copy(orders=self._orders + [(field_path, direction)])
+
+    def limit(self, count):
+        return self._copy(limit=count)
+
+    def stream(self):
+        client = self._parent._client
+        client._rpc('query')
+        docs = client._select(self._parent.path, self._filters, self._orders, self._limit)
+        for doc_id, data in docs:
+            yield DocumentSnapshot(self._parent.document(doc_id), data)
+
+    def get(self):
+        return list(self.stream())
+
+
+class WriteBatch:
+    def __init__(self, client):
+        self._client = client
+        self._writes = []
+
+    def set(self, reference, document_data, merge=False):
+        self._writes.append(('set', reference, document_data, merge))
+
+    def update(self, reference, field_updates):
+        self._writes.append(('update', reference, field_updates, False))
+
+    def delete(self, reference):
+        self._writes.append(('delete', reference, None, False))
+
+    def commit(self):
+        self._client._rpc('commit')
+        for kind, ref, data, merge in self._writes:
+            if kind == 'set':
+                self._client._write(ref._collection_path, ref.id, data, merge=merge)
+            elif kind == 'update':
+                self._client._update(ref._collection_path, ref.id, data)
+            else:
+                self._client._delete(ref._collection_path, ref.id)
+        self._writes = []
+
+
+_OPERATORS = {
+    '==': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+    'in': lambda a, b: a in b,
+    'not-in': lambda a, b: a not in b,
+    'array_contains': lambda a, b: isinstance(a, list) and b in a,
+    'array_contains_any': lambda a, b: isinstance(a, list) and any(x in a for x in b),
+}
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _resolve_sentinels(data):
+    resolved = {}
+    for key, value in data.items():
+        if value is firestore.SERVER_TIMESTAMP:
+            resolved[key] = _now()
+        elif isinstance(value, datetime.datetime) and value.tzinfo is None:
+            # Firestore zaman dilimi olmayan tarihleri UTC olarak saklar
+            resolved[key] = value.replace(tzinfo=datetime.timezone.utc)
+        elif isinstance(value, dict):
+            resolved[key] = _resolve_sentinels(value)
+        else:
+            resolved[key] = copy.deepcopy(value)
+    return resolved
+
+
+def _deep_merge(target, updates):
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _deep_merge(target[key], value)
+        else:
+            target[key] = value
@@ -0,0 +1,256 @@
+"""
+Uçtan uca API benchmark'ı (Firebase gerektirmez).
+
+Bellekteki Firestore (MemoryFirestore) üzerine farklı ölçeklerde sentetik
+kullanıcı, puan ve takip verisi yükler; her route için p50/p99 gecikme,
+throughput ve istek başına Firestore işlem sayısını raporlar.
+Recommender, data/Books.csv (yoksa sentetik bir katalog) ile eğitilir; böylece
+kitap route'ları 404 yerine gerçek kitaplar üzerinde ölçülür. 2xx dışı yanıtlar
+route başına ayrıca raporlanır.
+
+Kullanım (backend klasöründen):
+    python -m benchmarks.api_bench
+    python -m benchmarks.api_bench --scales 100,1000,10000 --requests 200 --latency-ms 5
+    python -m benchmarks.api_bench --catalog-size 50000 --synthetic
+"""
+import argparse
+import datetime
+import os
+import random
+import tempfile
+import time
+
+from app import create_app
+from app.ml.recommender import Recommender, set_recommender
+from benchmarks.common import WORDS, Table, latency_summary, make_synthetic_csv, write_json
+
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'Books.csv')
+
+
+def seed(db, n_users, book_ids, ratings_per_user=5, follows_per_user=3, seed_value=42):
+    """
+    Sentetik veri yükler. Yazmalar batch ile yapılır, ardından sayaçlar sıfırlanır.
+    """
+    rng = random.Random(seed_value)
+    uids = [f"user-{i:06d}" for i in range(n_users)]
+    base_time = datetime.datetime(2024, 1, 1)
+
+    batch = db.batch()
+    for i, uid in enumerate(uids):
+        batch.set(db.collection('users').document(uid), {
+            "uid": uid,
+            "email": f"{uid}@example.com",
+            "password": "secret",
+            "username": f"reader{i:06d}",
+        })
+
+        for book_id, title in rng.sample(book_ids, min(ratings_per_user, len(book_ids))):
+            rating_data = {
+                "user_id": uid,
+                "book_id": book_id,
+                "rating": rng.randint(1, 5),
+                "review": "",
+                "book_title": title,
+                "display_name": f"reader{i:06d}",
+                "timestamp": base_time + datetime.timedelta(minutes=rng.randint(0, 500000)),
+                "liked_by": [],
+            }
+            batch.set(db.collection('ratings').document(), rating_data)
+            batch.set(db.collection('users').document(uid).collection('ratings').document(book_id), rating_data)
+
+        book_id, title = rng.choice(book_ids)
+        batch.set(db.collection('users').document(uid).collection('wishlist').document(book_id), {
+            "book_id": book_id,
+            "book_title": title,
+            "image_url": None,
+            "added_at": base_time,
+        })
+
+        for other in rng.sample(uids, min(follows_per_user, n_users)):
+            if other == uid:
+                continue
+            batch.set(db.collection('following').document(uid).collection('user_following').document(other),
+                      {"followed_at": base_time})
+            batch.set(db.collection('followers').document(other).collection('user_followers').document(uid),
+                      {"followed_at": base_time})
+    batch.commit()
+    db.reset_stats()
+    return uids
+
+
+def load_catalog(csv_path, catalog_size, n=200, seed_value=3):
+    """
+    Recommender'ı verilen katalogla eğitip uygulamanın ortak örneği yapar.
+    Seed verisinde kullanılacak n adet (kitap id, başlık) çifti döndürür.
+    """
+    engine = Recommender(data_path=csv_path, max_books=catalog_size)
+    if engine.books_data.empty:
+        raise RuntimeError(f"Katalog yüklenemedi: {csv_path}")
+    set_recommender(engine)
+
+    rows = engine.books_data[['book_id', 'title']].drop_duplicates('title')
+    rows = rows.sample(n=min(n, len(rows)), random_state=seed_value)
+    return [(str(b), t) for b, t in rows.itertuples(index=False)]
+
+
+def build_routes(uids, book_ids, rating_ids):
+    """
+    Her route için (isim, method, url üretici, json üretici) listesi.
+    """
+    counter = {"n": 0}
+
+    def user(rng):
+        return rng.choice(uids)
+
+    def book(rng):
+        return rng.choice(book_ids)
+
+    def new_user(rng):
+        counter["n"] += 1
+        return {"email": f"bench{counter['n']}@example.com", "password": "x", "username": f"bench{counter['n']}"}
+
+    def login(rng):
+        return {"username": f"reader{rng.randrange(len(uids)):06d}", "password": "secret"}
+
+    def follow_pair(rng):
+        a, b = rng.sample(uids, 2)
+        return {"follower_id": a, "following_id": b}
+
+    def is_following(rng):
+        a, b = rng.sample(uids, 2)
+        return f"/api/auth/is_following?follower_id={a}&following_id={b}"
+
+    def rate(rng):
+        book_id, title = book(rng)
+        return f"/api/books/{book_id}/rate", {"user_id": user(rng), "rating": rng.randint(1, 5), "book_title": title}
+
+    return [
+        ("GET /", "GET", lambda r: ("/", None)),
+        ("POST /api/auth/register", "POST", lambda r: ("/api/auth/register", new_user(r))),
+        ("POST /api/auth/login", "POST", lambda r: ("/api/auth/login", login(r))),
+        ("GET /api/auth/user/<id>", "GET", lambda r: (f"/api/auth/user/{user(r)}", None)),
+        ("POST /api/auth/follow", "POST", lambda r: ("/api/auth/follow", follow_pair(r))),
+        ("POST /api/auth/unfollow", "POST", lambda r: ("/api/auth/unfollow", follow_pair(r))),
+        ("GET /api/auth/is_following", "GET", lambda r: (is_following(r), None)),
+        ("GET /api/auth/user/<id>/followers", "GET", lambda r: (f"/api/auth/user/{user(r)}/followers", None)),
+        ("GET /api/auth/user/<id>/following", "GET", lambda r: (f"/api/auth/user/{user(r)}/following", None)),
+        ("GET /api/auth/search", "GET", lambda r: ("/api/auth/search?query=reader00", None)),
+        ("GET /api/books/search", "GET", lambda r: (f"/api/books/search?query={r.choice(WORDS)}", None)),
+        ("POST /api/books/<id>/rate", "POST", rate),
+        ("GET /api/books/ratings/recent", "GET", lambda r: ("/api/books/ratings/recent", None)),
+        ("GET /api/books/<id>/reviews", "GET", lambda r: (f"/api/books/{book(r)[0]}/reviews", None)),
+        ("GET /api/books/users/<id>/ratings", "GET", lambda r: (f"/api/books/users/{user(r)}/ratings", None)),
+        ("GET /api/books/users/<id>/recommendations", "GET",
+         lambda r: (f"/api/books/users/{user(r)}/recommendations", None)),
+        ("GET /api/books/<id>/details", "GET", lambda r: (f"/api/books/{book(r)[0]}/details", None)),
+        ("GET /api/books/<id>/similar", "GET", lambda r: (f"/api/books/{book(r)[0]}/similar", None)),
+        ("POST /api/books/ratings/<id>/like", "POST", lambda r: (
+            f"/api/books/ratings/{r.choice(rating_ids)}/like", {"user_id": user(r)})),
+        ("POST /api/books/<id>/wishlist/toggle", "POST", lambda r: (
+            f"/api/books/{book(r)[0]}/wishlist/toggle", {"user_id": user(r), "book_title": book(r)[1]})),
+        ("GET /api/books/users/<id>/wishlist", "GET", lambda r: (f"/api/books/users/{user(r)}/wishlist", None)),
+        ("GET /api/books/<id>/wishlist/check", "GET", lambda r: (
+            f"/api/books/{book(r)[0]}/wishlist/check?user_id={user(r)}", None)),
+        ("DELETE /api/books/<id>/rate", "DELETE", lambda r: (
+            f"/api/books/{book(r)[0]}/rate?user_id={user(r)}", None)),
+    ]
+
+
+def bench_route(client, db, method, make_request, n_requests, warmup, rng):
+    for _ in range(warmup):
+        url, body = make_request(rng)
+        client.open(url, method=method, json=body)
+
+    db.reset_stats()
+    latencies = []
+    non_2xx = 0
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(n_requests):
+        url, body = make_request(rng)
+        t0 = time.perf_counter()
+        response = client.open(url, method=method, json=body)
+        latencies.append(time.perf_counter() - t0)
+        if not 200 <= response.status_code < 300:
+            non_2xx += 1
+        if response.status_code >= 500:
+            errors += 1
+    elapsed = time.perf_counter() - started
+
+    stats = latency_summary(latencies)
+    stats.update({
+        "rps": n_requests / elapsed if elapsed else 0.0,
+        "ops_per_req": db.ops / n_requests,
+        "non_2xx": non_2xx,
+        "errors": errors,
+    })
+    return stats
+
+
+def run(scales, n_requests, warmup, latency_ms, book_ids, route_filter=None):
+    results = []
+    for scale in scales:
+        app = create_app({"FIRESTORE_BACKEND": "memory", "FIRESTORE_LATENCY_MS": latency_ms})
+        db = app.extensions['firestore']
+        uids = seed(db, scale, book_ids)
+        rating_ids = [doc.id for doc in db.collection('ratings').limit(1000).stream()]
+        db.reset_stats()
+
+        client = app.test_client()
+        rng = random.Random(scale)
+        for name, method, make_request in build_routes(uids, book_ids, rating_ids):
+            if route_filter and route_filter not in name:
+                continue
+            stats = bench_route(client, db, method, make_request, n_requests, warmup, rng)
+            stats.update({"scale": scale, "route": name})
+            results.append(stats)
+            TABLE.print_row(stats)
+    return results
+
+
+TABLE = Table([
+    ("scale", 7, lambda s: str(s['scale']), '>'),
+    (" route", 46, lambda s: " " + s['route'], '<'),
+    ("p50 ms", 9, lambda s: f"{s['p50_ms']:.2f}", '>'),
+    ("p99 ms", 9, lambda s: f"{s['p99_ms']:.2f}", '>'),
+    ("req/s", 9, lambda s: f"{s['rps']:.1f}", '>'),
+    ("ops/req", 8, lambda s: f"{s['ops_per_req']:.1f}", '>'),
+    ("non-2xx", 8, lambda s: str(s['non_2xx']), '>'),
+    ("5xx", 4, lambda s: str(s['errors']), '>'),
+])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BookMind API benchmark (in-memory Firestore)")
+    parser.add_argument("--scales", default="100,1000,5000", help="Virgülle ayrılmış kullanıcı sayıları")
+    parser.add_argument("--requests", type=int, default=100, help="Route başına ölçülen istek sayısı")
+    parser.add_argument("--warmup", type=int, default=5, help="Route başına ısınma isteği sayısı")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Her Firestore RPC'sine eklenen gecikme")
+    parser.add_argument("--catalog-size", type=int, default=5000, help="Recommender'a yüklenecek kitap sayısı")
+    parser.add_argument("--csv", default=None, help="Books.csv yolu (varsayılan: data/Books.csv)")
+    parser.add_argument("--synthetic", action="store_true", help="Books.csv olsa bile sentetik katalog kullan")
+    parser.add_argument("--route", default=None, help="Yalnızca adında bu metin geçen route'ları ölç")
+    parser.add_argument("--json", dest="json_path", default=None, help="Sonuçları JSON dosyasına yaz")
+    args = parser.parse_args()
+
+    csv_path = args.csv or DEFAULT_CSV
+    tmp_dir = None
+    if args.synthetic or not os.path.exists(csv_path):
+        tmp_dir = tempfile.TemporaryDirectory()
+        csv_path = os.path.join(tmp_dir.name, 'Books.csv')
+        print(f"[INFO] Sentetik katalog üretiliyor ({args.catalog_size} kitap): {csv_path}")
+        make_synthetic_csv(csv_path, args.catalog_size)
+    book_ids = load_catalog(csv_path, args.catalog_size)
+    if tmp_dir is not None:
+        tmp_dir.cleanup()
+
+    scales = [int(s) for s in args.scales.split(",") if s]
+    TABLE.print_header()
+    results = run(scales, args.requests, args.warmup, args.latency_ms, book_ids, args.route)
+
+    if args.json_path:
+        write_json(results, args.json_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+api_bench ve recommender_bench için ortak yardımcılar:
+yüzdelik hesabı, tablo çıktısı, JSON kaydı ve sentetik katalog üretimi.
+"""
+import csv
+import json
+import random
+
+WORDS = (
+    "shadow night river house secret garden king queen war love stone fire moon star city "
+    "dark light lost last first little great world time dream winter summer road sea child "
+    "murder island book letters heart wind storm silent golden broken blood kingdom journey"
+).split()
+
+
+def percentile(sorted_values, pct):
+    """
+    Sıralı bir listede en yakın sıra (nearest-rank) yöntemiyle yüzdelik değeri.
+    """
+    if not sorted_values:
+        return 0.0
+    index = max(0, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def latency_summary(latencies):
+    """
+    Saniye cinsinden gecikmelerden milisaniye cinsinden p50/p99 döndürür.
+    """
+    samples = sorted(latencies)
+    return {"p50_ms": percentile(samples, 50) * 1000, "p99_ms": percentile(samples, 99) * 1000}
+
+
+class Table:
+    """
+    Sabit genişlikli sonuç tablosu. columns: (başlık, genişlik, sonuç -> metin, hizalama) listesi.
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def print_header(self):
+        print(" ".join(f"{title:{align}{width}}" for title, width, _, align in self.columns))
+
+    def print_row(self, result):
+        print(" ".join(f"{fmt(result):{align}{width}}" for _, width, fmt, align in self.columns))
+
+
+def write_json(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"[INFO] Sonuçlar yazıldı: {path}")
+
+
+def make_synthetic_csv(path, n_books, seed=7):
+    """
+    Books.csv (Book-Crossing) ile aynı sütunlara sahip sentetik bir katalog yazar.
+    """
+    rng = random.Random(seed)
+    authors = [f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()}son" for _ in range(max(1, n_books // 20))]
+    publishers = [f"{rng.choice(WORDS).title()} Press" for _ in range(200)]
+    with open(path, 'w', newline='', encoding='latin-1') as f:
+        writer = csv.writer(f)
+        writer.writerow(['ISBN', 'Book-Title', 'Book-Author', 'Year-Of-Publication', 'Publisher',
+                         'Image-URL-S', 'Image-URL-M', 'Image-URL-L'])
+        for i in range(n_books):
+            isbn = f"{i:010d}"
+            title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))).title()
+            url = f"http://images.example.com/{isbn}.jpg"
+            writer.writerow([isbn, title, rng.choice(authors), rng.randint(1950, 2004),
+                             rng.choice(publishers), url, url, url])
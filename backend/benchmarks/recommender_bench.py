@@ -0,0 +1,154 @@
+"""
+Recommender benchmark'ı: farklı katalog boyutlarında model kurulum süresi,
+tepe bellek (peak RSS) ve sorgu başına gecikme (get_recommendations,
+search_books, get_popular_books).
+
+Her boyut ayrı bir süreçte çalışır, böylece peak RSS ölçümleri birbirini etkilemez.
+Books.csv yoksa (veya --synthetic verilirse) Book-Crossing formatında sentetik bir CSV üretilir.
+
+Kullanım (backend klasöründen):
+    python -m benchmarks.recommender_bench
+    python -m benchmarks.recommender_bench --sizes 5000,50000,full --queries 200
+    python -m benchmarks.recommender_bench --csv data/Books.csv
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+from benchmarks.common import WORDS, Table, latency_summary, make_synthetic_csv, write_json
+
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'Books.csv')
+# Book-Crossing veri setindeki kitap sayısı
+FULL_SYNTHETIC_SIZE = 271360
+
+
+def peak_rss_mb():
+    # Linux'ta ru_maxrss KB, macOS'ta byte cinsindendir
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def time_calls(fn, args_list):
+    latencies = []
+    for args in args_list:
+        t0 = time.perf_counter()
+        fn(*args)
+        latencies.append(time.perf_counter() - t0)
+    return latency_summary(latencies)
+
+
+def bench_size(csv_path, size, n_queries, seed=11):
+    """
+    Tek bir katalog boyutu için ölçüm yapar (ayrı süreçte çağrılır).
+    """
+    from app.ml.recommender import Recommender
+
+    baseline_rss = peak_rss_mb()
+    started = time.perf_counter()
+    engine = Recommender(data_path=csv_path, max_books=size)
+    build_s = time.perf_counter() - started
+    build_rss = peak_rss_mb()
+
+    rng = random.Random(seed)
+    titles = engine.books_data['title'].tolist()
+    sample_titles = [(rng.choice(titles),) for _ in range(n_queries)] if titles else []
+    search_terms = [(rng.choice(WORDS),) for _ in range(n_queries)]
+
+    # İlk tur önbelleği ısıtmadan (miss), ikinci tur aynı başlıklarla (hit) ölçülür
+    cold = time_calls(engine.get_recommendations, sample_titles)
+    warm = time_calls(engine.get_recommendations, sample_titles)
+
+    return {
+        "size": len(engine.books_data),
+        "build_s": build_s,
+        "peak_rss_mb": peak_rss_mb(),
+        "build_rss_delta_mb": build_rss - baseline_rss,
+        "recommend_cold": cold,
+        "recommend_cached": warm,
+        "search": time_calls(engine.search_books, search_terms),
+        "popular": time_calls(engine.get_popular_books, [(10,)] * n_queries),
+    }
+
+
+def _worker(csv_path, size, n_queries, queue):
+    try:
+        queue.put(bench_size(csv_path, size, n_queries))
+    except BaseException as e:
+        queue.put({"size": size, "error": repr(e)})
+
+
+def run_isolated(csv_path, size, n_queries):
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_worker, args=(csv_path, size, n_queries, queue))
+    process.start()
+    process.join()
+    if process.exitcode != 0:
+        return {"size": size, "error": f"worker exited with code {process.exitcode} (out of memory?)"}
+    return queue.get()
+
+
+def _pair(key):
+    return lambda r: f"{r[key]['p50_ms']:.2f}/{r[key]['p99_ms']:.2f}"
+
+
+TABLE = Table([
+    ("books", 8, lambda r: str(r['size']), '>'),
+    ("build s", 8, lambda r: f"{r['build_s']:.2f}", '>'),
+    ("peak MB", 8, lambda r: f"{r['peak_rss_mb']:.0f}", '>'),
+    ("+MB", 8, lambda r: f"{r['build_rss_delta_mb']:.0f}", '>'),
+    ("rec p50/p99 ms", 16, _pair('recommend_cold'), '>'),
+    ("cached p50/p99", 16, _pair('recommend_cached'), '>'),
+    ("search p50/p99", 16, _pair('search'), '>'),
+    ("popular p50/p99", 16, _pair('popular'), '>'),
+])
+
+
+def print_row(result):
+    if "error" in result:
+        print(f"{str(result['size']):>8}  ERROR: {result['error']}")
+    else:
+        TABLE.print_row(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BookMind Recommender benchmark")
+    parser.add_argument("--sizes", default="5000,50000,full",
+                        help="Virgülle ayrılmış katalog boyutları; 'full' tüm katalog")
+    parser.add_argument("--queries", type=int, default=100, help="Her ölçüm için sorgu sayısı")
+    parser.add_argument("--csv", default=None, help="Books.csv yolu (varsayılan: data/Books.csv)")
+    parser.add_argument("--synthetic", action="store_true", help="Books.csv olsa bile sentetik katalog kullan")
+    parser.add_argument("--full-size", type=int, default=FULL_SYNTHETIC_SIZE,
+                        help="Sentetik katalogda 'full' boyutu")
+    parser.add_argument("--json", dest="json_path", default=None, help="Sonuçları JSON dosyasına yaz")
+    args = parser.parse_args()
+
+    csv_path = args.csv or DEFAULT_CSV
+    tmp_dir = None
+    if args.synthetic or not os.path.exists(csv_path):
+        tmp_dir = tempfile.TemporaryDirectory()
+        csv_path = os.path.join(tmp_dir.name, 'Books.csv')
+        print(f"[INFO] Sentetik katalog üretiliyor ({args.full_size} kitap): {csv_path}")
+        make_synthetic_csv(csv_path, args.full_size)
+
+    sizes = [None if s == 'full' else int(s) for s in args.sizes.split(",") if s]
+    TABLE.print_header()
+    results = []
+    for size in sizes:
+        result = run_isolated(csv_path, size, args.queries)
+        results.append(result)
+        print_row(result)
+
+    if args.json_path:
+        write_json(results, args.json_path)
+    if tmp_dir is not None:
+        tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Recommender regresyon kontrolleri: satır bazlı benzerlik + önbellek, eski yoğun
+cosine_sim matrisi ile aynı sonuçları vermeli.
+
+Çalıştırma (backend klasöründen):
+    python -m pytest tests
+"""
+import random
+
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import linear_kernel
+
+from app.ml.recommender import Recommender
+from benchmarks.common import make_synthetic_csv
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    path = tmp_path_factory.mktemp("catalog") / "Books.csv"
+    make_synthetic_csv(str(path), 2000)
+    return Recommender(data_path=str(path), max_books=2000)
+
+
+def legacy_recommendations(engine, title):
+    # Eski uygulama: tüm n x n cosine_sim matrisi ve sorted() ile ilk 5 (kendisi hariç)
+    tfidf_matrix = TfidfVectorizer(stop_words='english').fit_transform(engine.books_data['combined_features'])
+    cosine_sim = linear_kernel(tfidf_matrix, tfidf_matrix)
+    idx = engine.books_data.index[engine.books_data['title'] == title][0]
+    sim_scores = sorted(enumerate(cosine_sim[idx]), key=lambda x: x[1], reverse=True)[1:6]
+    return engine.books_data.iloc[[i[0] for i in sim_scores]].to_dict('records')
+
+
+def book_ids(books):
+    return [book['book_id'] for book in books]
+
+
+def test_matches_dense_cosine_implementation(engine):
+    titles = random.Random(5).sample(list(engine.books_data['title'].unique()), 50)
+    for title in titles:
+        assert book_ids(engine.get_recommendations(title)) == book_ids(legacy_recommendations(engine, title))
+
+
+def test_cache_hit_returns_copies(engine):
+    title = engine.books_data['title'].iloc[0]
+    first = engine.get_recommendations(title)
+    hits = engine.cache_hits
+
+    first[0]['title'] = 'changed by caller'
+    first.append({'book_id': 'extra'})
+    second = engine.get_recommendations(title)
+
+    assert engine.cache_hits == hits + 1
+    assert book_ids(second) == book_ids(legacy_recommendations(engine, title))
+    assert second[0]['title'] != 'changed by caller'
+
+
+def test_unknown_title_returns_empty(engine):
+    assert engine.get_recommendations('no such book title') == []